@@ -33,6 +33,7 @@ setup(
             "nbformat",
             "numpy",
             "matplotlib",
+            "pyarrow",
         ]
     },
 )
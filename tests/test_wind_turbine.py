@@ -7,10 +7,20 @@ SPDX-License-Identifier: MIT
 
 import pytest
 import os
+import sys
+import json
+import types
+import shutil
+import pandas as pd
 from windpowerlib.tools import WindpowerlibUserWarning
+from windpowerlib import wind_turbine
 
 from windpowerlib.wind_turbine import (
     get_turbine_data_from_file,
+    _load_turbine_library,
+    _find_turbine_library,
+    _parse_list,
+    _save_parquet,
     WindTurbine,
     get_turbine_types,
     WindTurbineGroup,
@@ -39,6 +49,150 @@ class TestWindTurbine:
         with pytest.raises(FileNotFoundError):
             get_turbine_data_from_file(turbine_type="...", path="not_existent")
 
+    def test_turbine_library_is_cached(self, tmpdir):
+        fn = os.path.join(str(tmpdir), "power_curves.csv")
+        shutil.copy(os.path.join(self.source, "power_curves.csv"), fn)
+        df = _load_turbine_library(*_find_turbine_library(fn))
+        assert _load_turbine_library(*_find_turbine_library(fn)) is df
+        # a modified file is read again
+        os.utime(fn, (0, os.path.getmtime(fn) + 10))
+        df_modified = _load_turbine_library(*_find_turbine_library(fn))
+        assert df_modified is not df
+        # a file rewritten with the same modification time is read again if
+        # its size changed
+        mtime_ns = os.stat(fn).st_mtime_ns
+        with open(fn, "a") as f:
+            f.write("DUMMY 5\n")
+        os.utime(fn, ns=(0, mtime_ns))
+        df_rewritten = _load_turbine_library(*_find_turbine_library(fn))
+        assert df_rewritten is not df_modified
+
+    def test_turbine_type_not_provided(self):
+        fn = os.path.join(self.source, "power_curves.csv")
+        with pytest.raises(KeyError, match=r"Similar types: \['DUMMY 3'"):
+            get_turbine_data_from_file("DUMMY", fn)
+        with pytest.raises(KeyError) as err:
+            get_turbine_data_from_file("no_turbine", fn)
+        assert "Similar types" not in str(err.value)
+
+    def test_get_turbine_data_from_file_returns_copy(self):
+        fn = os.path.join(self.source, "power_curves.csv")
+        power_curve = get_turbine_data_from_file("DUMMY 3", fn)
+        power_curve["value"] *= 2
+        assert get_turbine_data_from_file("DUMMY 3", fn)["value"][7] == 18000
+
+    def test_turbine_library_read_with_pyarrow(self, monkeypatch):
+        pytest.importorskip("pyarrow")
+        fn = os.path.join(self.source, "turbine_data.csv")
+        expected = pd.read_csv(fn, index_col=0)
+        monkeypatch.setattr(wind_turbine, "PYARROW_MIN_FILE_SIZE", 0)
+        # use another version than the other tests to bypass the cache
+        df = _load_turbine_library(fn, (-1, -1))
+        pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+
+    def test_turbine_library_from_parquet(self, tmpdir):
+        pytest.importorskip("pyarrow")
+        fn = os.path.join(str(tmpdir), "power_curves.csv")
+        shutil.copy(os.path.join(self.source, "power_curves.csv"), fn)
+        expected = get_turbine_data_from_file("DUMMY 3", fn)
+        df = pd.read_csv(fn, index_col=0)
+        # write different values to the parquet file to see which is used
+        _save_parquet(df * 2, fn)
+        parquet_df = pd.read_parquet(fn.replace(".csv", ".parquet"))
+        assert list(parquet_df.columns) == [
+            "turbine_type",
+            "wind_speed",
+            "value",
+        ]
+        power_curve = get_turbine_data_from_file("DUMMY 3", fn)
+        assert (power_curve["value"] == 2 * expected["value"]).all()
+        with pytest.raises(KeyError, match="DUMMY 4711 not provided"):
+            get_turbine_data_from_file("DUMMY 4711", fn)
+        # a csv file newer than the parquet file is used
+        mtime = os.path.getmtime(fn.replace(".csv", ".parquet"))
+        os.utime(fn, (0, mtime + 10))
+        power_curve = get_turbine_data_from_file("DUMMY 3", fn)
+        pd.testing.assert_frame_equal(power_curve, expected)
+
+    def test_parquet_curves_of_different_length(self, tmpdir):
+        pytest.importorskip("pyarrow")
+        fn = os.path.join(str(tmpdir), "power_curves.csv")
+        df = pd.DataFrame(
+            {0.0: [0.0, 0.0], 1.0: [10.0, None], 2.0: [20.0, None]},
+            index=pd.Index(["LONG", "SHORT"], name="turbine_type"),
+        )
+        df.to_csv(fn)
+        expected = {
+            turbine_type: get_turbine_data_from_file(turbine_type, fn)
+            for turbine_type in df.index
+        }
+        _save_parquet(df, fn)
+        parquet_fn = fn.replace(".csv", ".parquet")
+        assert pd.read_parquet(parquet_fn)["value"].notna().all()
+        for turbine_type in df.index:
+            curve = get_turbine_data_from_file(turbine_type, parquet_fn)
+            assert curve["value"].notna().all()
+            pd.testing.assert_frame_equal(curve, expected[turbine_type])
+        # files written by pandas >= 3.0 may contain wind speeds outside of
+        # the curve
+        long_df = pd.DataFrame(
+            {
+                "turbine_type": ["SHORT", "SHORT", "SHORT"],
+                "wind_speed": [0.0, 1.0, 2.0],
+                "value": [0.0, None, None],
+            }
+        )
+        long_df.to_parquet(parquet_fn)
+        curve = get_turbine_data_from_file("SHORT", parquet_fn)
+        pd.testing.assert_frame_equal(curve, expected["SHORT"])
+
+    def test_parquet_file_ignored_without_engine(self, tmpdir, monkeypatch):
+        fn = os.path.join(str(tmpdir), "power_curves.csv")
+        shutil.copy(os.path.join(self.source, "power_curves.csv"), fn)
+        parquet_fn = fn.replace(".csv", ".parquet")
+        with open(parquet_fn, "w") as f:
+            f.write("not a parquet file")
+        os.utime(parquet_fn, (0, os.path.getmtime(fn) + 10))
+        monkeypatch.setattr(
+            wind_turbine, "_parquet_engine_installed", lambda: False
+        )
+        power_curve = get_turbine_data_from_file("DUMMY 3", fn)
+        assert power_curve["value"][7] == 18000
+
+    @pytest.mark.parametrize("error", [ImportError, TypeError, ValueError])
+    def test_save_parquet_failure(self, tmpdir, monkeypatch, error):
+        fn = os.path.join(str(tmpdir), "power_curves.csv")
+        parquet_fn = fn.replace(".csv", ".parquet")
+        with open(parquet_fn, "w") as f:
+            f.write("outdated parquet file")
+
+        def to_parquet(*args, **kwargs):
+            raise error("failed")
+
+        monkeypatch.setattr(pd.DataFrame, "to_parquet", to_parquet)
+        _save_parquet(
+            pd.read_csv(
+                os.path.join(self.source, "power_curves.csv"), index_col=0
+            ),
+            fn,
+        )
+        assert not os.path.isfile(parquet_fn)
+
+    def test_library_in_directory_named_turbine_data(self, tmpdir):
+        path = os.path.join(str(tmpdir), "turbine_data")
+        shutil.copytree(self.source, path)
+        example_turbine = {
+            "hub_height": 100,
+            "rotor_diameter": 70,
+            "turbine_type": "DUMMY 3",
+            "path": path,
+        }
+        assert WindTurbine(**example_turbine).power_curve["value"][7] == 18000
+        pytest.importorskip("pyarrow")
+        fn = os.path.join(path, "power_curves.csv")
+        _save_parquet(pd.read_csv(fn, index_col=0), fn)
+        assert WindTurbine(**example_turbine).power_curve["value"][7] == 18000
+
     def test_get_turbine_types(self, capsys):
         get_turbine_types()
         captured = capsys.readouterr()
@@ -48,6 +202,107 @@ class TestWindTurbine:
         with pytest.raises(ValueError, match=msg):
             get_turbine_types("wrong")
 
+    def test_parse_list(self):
+        assert _parse_list("[0.0, 0.5, 1]") == [0.0, 0.5, 1]
+        assert _parse_list("(0.0, 0.5, 1)") == (0.0, 0.5, 1)
+        with pytest.raises(ValueError):
+            _parse_list("__import__('os').getcwd()")
+
+    def test_get_turbine_types_keeps_display_options(self, capsys):
+        with pd.option_context("display.max_rows", 5):
+            get_turbine_types()
+            assert pd.get_option("display.max_rows") == 5
+        captured = capsys.readouterr()
+        assert "E-126/4200" in captured.out
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_load_turbine_data_from_oedb(
+        self, tmpdir, monkeypatch, use_orjson
+    ):
+        """Load turbine data from a mocked oedb response."""
+        # a repeated wind speed and a python literal that is not valid json
+        curves = {
+            "power_curve_wind_speeds": [
+                "[0.0, 1.0, 1.0, 2.0]",
+                "(0.0, 1.0, 2.0, 3.0)",
+            ],
+            "power_curve_values": [
+                "[0.0, 1.0, 5.0, 2.0]",
+                "(0.0, 0.5, 1.5, 2.0)",
+            ],
+            "power_coefficient_curve_wind_speeds": [None, None],
+            "power_coefficient_curve_values": [None, None],
+            "thrust_coefficient_curve_wind_speeds": [None, None],
+            "thrust_coefficient_curve_values": [None, None],
+        }
+        rows = [
+            dict(
+                turbine_type=turbine_type,
+                manufacturer="Dummy",
+                nominal_power=2.0,
+                **{key: value[i] for key, value in curves.items()},
+            )
+            for i, turbine_type in enumerate(["DUMMY A", "DUMMY B"])
+        ]
+        content = json.dumps(rows).encode()
+        decoded = []
+
+        class Response:
+            status_code = 200
+
+            @property
+            def content(self):
+                decoded.append("orjson")
+                return content
+
+            def json(self):
+                decoded.append("json")
+                return json.loads(content)
+
+        class Session:
+            def get(self, url, **kwargs):
+                self.kwargs = kwargs
+                return Response()
+
+        session = Session()
+        monkeypatch.setattr(wind_turbine, "_get_session", lambda: session)
+        if use_orjson:
+            orjson = types.ModuleType("orjson")
+            orjson.loads = json.loads
+            monkeypatch.setitem(sys.modules, "orjson", orjson)
+        else:
+            monkeypatch.setitem(sys.modules, "orjson", None)
+        # save the files to tmpdir instead of the package
+        monkeypatch.setattr(
+            wind_turbine, "__file__", os.path.join(str(tmpdir), "x.py")
+        )
+        path = os.path.join(str(tmpdir), "oedb")
+        os.mkdir(path)
+
+        turbine_data = load_turbine_data_from_oedb()
+        assert session.kwargs["timeout"] == wind_turbine.OEDB_TIMEOUT
+        assert decoded == ["orjson" if use_orjson else "json"]
+        assert list(turbine_data["turbine_type"]) == ["DUMMY A", "DUMMY B"]
+        fn = os.path.join(path, "power_curves.csv")
+        power_curves = pd.read_csv(fn, index_col=0)
+        assert list(power_curves.columns) == ["0.0", "1.0", "2.0", "3.0"]
+        # the first value of a repeated wind speed is kept
+        curve = get_turbine_data_from_file("DUMMY A", fn)
+        assert list(curve["wind_speed"]) == [0.0, 1.0, 2.0]
+        assert list(curve["value"]) == [0.0, 1000.0, 2000.0]
+        curve = get_turbine_data_from_file("DUMMY B", fn)
+        assert list(curve["value"]) == [0.0, 500.0, 1500.0, 2000.0]
+        cp_curves = pd.read_csv(
+            os.path.join(path, "power_coefficient_curves.csv"), index_col=0
+        )
+        assert cp_curves.empty
+        data = get_turbine_data_from_file(
+            "DUMMY B", os.path.join(path, "turbine_data.csv")
+        )
+        assert data["nominal_power"].iloc[0] == 2000
+        if wind_turbine._parquet_engine_installed():
+            assert os.path.isfile(os.path.join(path, "power_curves.parquet"))
+
     def test_wrong_url_load_turbine_data(self):
         """Load turbine data from oedb."""
 
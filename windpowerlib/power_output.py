@@ -246,23 +246,23 @@ def power_curve_density_correction(
             + "density corrected power curve density at hub "
             + "height is needed."
         )
+    # use numpy arrays in the loop over all time steps to avoid the overhead
+    # of pandas indexing and arithmetics in each step
+    power_curve_wind_speeds = np.asarray(power_curve_wind_speeds)
+    power_curve_values = np.asarray(power_curve_values)
+    # exponent of the density correction does not depend on the time step
+    exponent = np.interp(power_curve_wind_speeds, [7.5, 12.5], [1 / 3, 2 / 3])
     power_output = [
-        (
-            np.interp(
-                wind_speed[i],
-                power_curve_wind_speeds
-                * (1.225 / density[i])
-                ** (
-                    np.interp(
-                        power_curve_wind_speeds, [7.5, 12.5], [1 / 3, 2 / 3]
-                    )
-                ),
-                power_curve_values,
-                left=0,
-                right=0,
-            )
+        np.interp(
+            wind_speed_i,
+            power_curve_wind_speeds * (1.225 / density_i) ** exponent,
+            power_curve_values,
+            left=0,
+            right=0,
+        )
+        for wind_speed_i, density_i in zip(
+            np.asarray(wind_speed), np.asarray(density)
         )
-        for i in range(len(wind_speed))
     ]
 
     # Power_output as pd.Series if wind_speed is pd.Series (else: np.array)
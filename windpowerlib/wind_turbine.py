@@ -9,11 +9,31 @@ SPDX-License-Identifier: MIT
 import pandas as pd
 import logging
 import warnings
-import requests
 import os
+import ast
+import json
+from functools import lru_cache
 from windpowerlib.tools import WindpowerlibUserWarning
 from typing import NamedTuple
 
+# Turbine library files larger than this (in bytes) are parsed with the
+# pyarrow csv engine if it is available. For small files like the bundled
+# oedb library the default C engine is faster.
+PYARROW_MIN_FILE_SIZE = 10 ** 6
+
+# Timeout of requests to the oedb in seconds (connect, read)
+OEDB_TIMEOUT = (5, 30)
+
+# Session for requests to the oedb, created on first use
+_SESSION = None
+
+# File names of the turbine library
+LIBRARY_FILES = {
+    "power_curve": "power_curves.csv",
+    "power_coefficient_curve": "power_coefficient_curves.csv",
+    "turbine_data": "turbine_data.csv",
+}
+
 
 class WindTurbine(object):
     r"""
@@ -137,42 +157,32 @@ class WindTurbine(object):
             path = os.path.join(os.path.dirname(__file__), "oedb")
 
         if turbine_type is not None and path is not None:
+            (
+                file_power_curve,
+                file_power_coefficient_curve,
+                turbine_data,
+            ) = _fetch_turbine_data(
+                self.turbine_type,
+                path,
+                power_curve=power_curve is None,
+                power_coefficient_curve=power_coefficient_curve is None,
+                turbine_data=nominal_power is None or rotor_diameter is None,
+            )
             if power_curve is None:
-                try:
-                    fn = os.path.join(path, "power_curves.csv")
-                    self.power_curve = get_turbine_data_from_file(
-                        self.turbine_type, fn
-                    )
-                except KeyError:
-                    msg = "No power curve found for {0}"
-                    logging.debug(msg.format(self.turbine_type))
+                self.power_curve = file_power_curve
             if power_coefficient_curve is None:
-                try:
-                    fn = os.path.join(path, "power_coefficient_curves.csv")
-                    self.power_coefficient_curve = get_turbine_data_from_file(
-                        self.turbine_type, fn
-                    )
-                except KeyError:
-                    msg = "No power coefficient curve found for {0}"
-                    logging.debug(msg.format(self.turbine_type))
+                self.power_coefficient_curve = file_power_coefficient_curve
 
-            if nominal_power is None or (
-                rotor_diameter is None
-                and self.power_coefficient_curve is not None
+            if turbine_data is not None and (
+                nominal_power is None
+                or (
+                    rotor_diameter is None
+                    and self.power_coefficient_curve is not None
+                )
             ):
-                turbine_data = None
-                try:
-                    fn = os.path.join(path, "turbine_data.csv")
-                    turbine_data = get_turbine_data_from_file(
-                        self.turbine_type, fn
-                    )
-                except KeyError:
-                    msg = "No turbine data found for {0}"
-                    logging.debug(msg.format(self.turbine_type))
-
-                if self.nominal_power is None and turbine_data is not None:
+                if self.nominal_power is None:
                     self.nominal_power = float(turbine_data["nominal_power"])
-                if self.rotor_diameter is None and turbine_data is not None:
+                if self.rotor_diameter is None:
                     self.rotor_diameter = float(turbine_data["rotor_diameter"])
 
         if self.rotor_diameter:
@@ -363,7 +373,9 @@ def get_turbine_data_from_file(turbine_type, path):
         Specifies the turbine type data is fetched for.
     path : str
         Specifies the source of the turbine data.
-        See the example below for how to use the example data.
+        See the example below for how to use the example data. If a parquet
+        file with the same name exists and is not older than the csv file it
+        is read instead.
 
     Returns
     -------
@@ -388,25 +400,398 @@ def get_turbine_data_from_file(turbine_type, path):
     """
 
     try:
-        df = pd.read_csv(path, index_col=0)
+        library_file = _find_turbine_library(path)
     except FileNotFoundError:
         raise FileNotFoundError("The file '{}' was not found.".format(path))
-    wpp_df = df[df.index == turbine_type].copy()
-    # if turbine not in data file
-    if wpp_df.shape[0] == 0:
-        msg = "Wind converter type {0} not provided. Possible types: {1}"
-        raise KeyError(msg.format(turbine_type, list(df.index)))
+    # copy, as the cached data is shared by all callers
+    return _get_turbine_data_from_library(turbine_type, *library_file).copy()
+
+
+@lru_cache(maxsize=1024)
+def _get_turbine_data_from_library(turbine_type, path, version):
+    r"""
+    Extracts the data of one turbine type from a turbine library file.
+
+    The results are kept in memory, so that the data of each turbine type is
+    only extracted once per process. The returned DataFrame is shared between
+    all callers and must not be modified in place.
+
+    Parameters
+    ----------
+    turbine_type : str
+        Specifies the turbine type data is fetched for.
+    path : str
+        Path of the csv or parquet file.
+    version : tuple
+        Modification time in nanoseconds and size of the file in bytes as
+        returned by :py:func:`~._find_turbine_library`.
+
+    Returns
+    -------
+    :pandas:`pandas.DataFrame<frame>`
+        See :py:func:`~.get_turbine_data_from_file`.
+
+    """
+    is_turbine_data = "turbine_data" in os.path.basename(path)
+    if path.endswith(".parquet") and not is_turbine_data:
+        return _get_curve_from_parquet(turbine_type, path, version)
+    df = _load_turbine_library(path, version)
+    try:
+        # position(s) of the turbine type, hash lookup for a unique index
+        loc = df.index.get_loc(turbine_type)
+    except KeyError:
+        # turbine not in data file
+        raise _turbine_type_not_found(turbine_type, df.index)
+    if isinstance(loc, int):
+        loc = slice(loc, loc + 1)
     # if turbine in data file
     # get nominal power or power (coefficient) curve
-    if "turbine_data" in path:
-        return wpp_df
+    if is_turbine_data:
+        return df.iloc[loc]
+    else:
+        curve = df.iloc[loc].dropna(axis=1)
+        # wind speeds are the column names, values are in the turbine's row
+        return pd.DataFrame(
+            {
+                "wind_speed": curve.columns.astype(float),
+                "value": curve.iloc[0].values,
+            }
+        )
+
+
+def _get_curve_from_parquet(turbine_type, path, version):
+    r"""
+    Reads the power (coefficient) curve of one turbine type from a parquet
+    file in long format (see :py:func:`~._save_parquet`).
+
+    Only the rows of `turbine_type` are read from the file.
+
+    Parameters
+    ----------
+    turbine_type : str
+        Specifies the turbine type data is fetched for.
+    path : str
+        Path of the parquet file.
+    version : tuple
+        Modification time in nanoseconds and size of the file in bytes as
+        returned by :py:func:`~._find_turbine_library`.
+
+    Returns
+    -------
+    :pandas:`pandas.DataFrame<frame>`
+        Power (coefficient) curve with the columns 'wind_speed' and 'value'.
+
+    """
+    turbine_types = _load_turbine_types(path, version)
+    if turbine_type not in turbine_types:
+        raise _turbine_type_not_found(turbine_type, turbine_types)
+    curve = pd.read_parquet(
+        path,
+        columns=["turbine_type", "wind_speed", "value"],
+        filters=[("turbine_type", "==", turbine_type)],
+    )
+    # some engines only filter row groups, files written with pandas >= 3.0
+    # may contain wind speeds outside of the curve
+    curve = curve[
+        (curve["turbine_type"] == turbine_type) & curve["value"].notna()
+    ]
+    return pd.DataFrame(
+        {
+            "wind_speed": curve["wind_speed"].values,
+            "value": curve["value"].values,
+        }
+    )
+
+
+@lru_cache(maxsize=8)
+def _load_turbine_types(path, version):
+    r"""
+    Reads the turbine types of a parquet file in long format.
+
+    Parameters
+    ----------
+    path : str
+        Path of the parquet file.
+    version : tuple
+        Modification time in nanoseconds and size of the file in bytes as
+        returned by :py:func:`~._find_turbine_library`.
+
+    Returns
+    -------
+    :pandas:`pandas.Index<api/pandas.Index>`
+        Unique turbine types in the order of the file.
+
+    """
+    turbine_types = pd.read_parquet(path, columns=["turbine_type"])
+    return pd.Index(turbine_types["turbine_type"].unique())
+
+
+def _turbine_type_not_found(turbine_type, turbine_types):
+    r"""
+    Returns the error raised for a turbine type missing in a library file.
+
+    The message suggests up to 20 turbine types of the library file that
+    start like `turbine_type` (e.g. 'E-126/4200' for 'E-126/4201').
+
+    Parameters
+    ----------
+    turbine_type : str
+        Turbine type that was not found.
+    turbine_types : :pandas:`pandas.Index<api/pandas.Index>`
+        Turbine types provided in the library file.
+
+    Returns
+    -------
+    KeyError
+
+    """
+    prefix = str(turbine_type).split("/")[0]
+    similar_types = [t for t in turbine_types if str(t).startswith(prefix)]
+    msg = "Wind converter type {0} not provided.".format(turbine_type)
+    if similar_types:
+        msg += " Similar types: {0}".format(similar_types[:20])
+    return KeyError(msg)
+
+
+def _read_turbine_library(path):
+    r"""
+    Returns the (cached) content of a turbine library file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the csv file. See :py:func:`~._find_turbine_library`.
+
+    Returns
+    -------
+    :pandas:`pandas.DataFrame<frame>`
+        Content of the file with turbine types as index.
+
+    """
+    return _load_turbine_library(*_find_turbine_library(path))
+
+
+def _find_turbine_library(path):
+    r"""
+    Returns the turbine library file to read and its version.
+
+    A parquet file next to the csv file `path` (e.g. 'power_curves.parquet'
+    for 'power_curves.csv') is used instead of the csv file if it is at least
+    as new as the csv file and pyarrow or fastparquet is installed. Edit or
+    delete the parquet file after changing the csv file manually.
+
+    Parameters
+    ----------
+    path : str
+        Path of the csv file.
+
+    Returns
+    -------
+    tuple
+        Path of the csv or parquet file and its version, a tuple of the
+        modification time in nanoseconds and the size of the file in bytes.
+        The version is part of the cache keys of the turbine library, so a
+        file that is rewritten within the resolution of the file system's
+        modification time is read again if its size changed.
+
+    """
+    parquet_path = os.path.splitext(path)[0] + ".parquet"
+    if (
+        _parquet_engine_installed()
+        and os.path.isfile(parquet_path)
+        and (
+            not os.path.isfile(path)
+            or os.path.getmtime(parquet_path) >= os.path.getmtime(path)
+        )
+    ):
+        path = parquet_path
+    stat = os.stat(path)
+    return path, (stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=1)
+def _parquet_engine_installed():
+    r"""
+    Checks if parquet files can be read and written.
+
+    Returns
+    -------
+    bool
+        True if pandas supports parquet files and pyarrow or fastparquet can
+        be imported.
+
+    """
+    if not hasattr(pd, "read_parquet"):
+        return False
+    for engine in ["pyarrow", "fastparquet"]:
+        try:
+            __import__(engine)
+        except ImportError:
+            continue
+        return True
+    return False
+
+
+def _fetch_turbine_data(
+    turbine_type,
+    path,
+    power_curve=True,
+    power_coefficient_curve=True,
+    turbine_data=True,
+):
+    r"""
+    Fetches all requested data of one turbine type from a turbine library.
+
+    Used by :class:`~.WindTurbine` to look up the power curve, power
+    coefficient curve and turbine data in one call.
+
+    Parameters
+    ----------
+    turbine_type : str
+        Specifies the turbine type data is fetched for.
+    path : str
+        Directory of the turbine library files 'power_curves.csv',
+        'power_coefficient_curves.csv' and 'turbine_data.csv'.
+    power_curve : bool
+        If True the power curve is fetched. Default: True.
+    power_coefficient_curve : bool
+        If True the power coefficient curve is fetched. Default: True.
+    turbine_data : bool
+        If True the turbine data (e.g. nominal power) is fetched.
+        Default: True.
+
+    Returns
+    -------
+    tuple
+        Power curve, power coefficient curve and turbine data as returned by
+        :py:func:`~.get_turbine_data_from_file`. Data that was not requested
+        or is not provided for the turbine type is None.
+
+    """
+    if not (power_curve or power_coefficient_curve or turbine_data):
+        return None, None, None
+    data = []
+    for name, fetch in [
+        ("power_curve", power_curve),
+        ("power_coefficient_curve", power_coefficient_curve),
+        ("turbine_data", turbine_data),
+    ]:
+        turbine_data_of_type = None
+        if fetch:
+            try:
+                turbine_data_of_type = get_turbine_data_from_file(
+                    turbine_type, os.path.join(path, LIBRARY_FILES[name])
+                )
+            except KeyError:
+                # formatted by logging only if debug messages are emitted
+                logging.debug(
+                    "No %s found for %s", name.replace("_", " "), turbine_type
+                )
+        data.append(turbine_data_of_type)
+    return tuple(data)
+
+
+@lru_cache(maxsize=8)
+def _load_turbine_library(path, version):
+    r"""
+    Reads a turbine library csv or parquet file and keeps it in memory.
+
+    The version (modification time and size) of the file is part of the
+    cache key, so a file that is changed on disk (e.g. by
+    :py:func:`~.load_turbine_data_from_oedb`) is read again. The returned
+    DataFrame is shared between all callers and must not be modified in
+    place.
+
+    Large files are parsed with the pyarrow engine of
+    :pandas:`pandas.read_csv<api/pandas.read_csv>` if pyarrow is installed (see
+    `PYARROW_MIN_FILE_SIZE`).
+
+    Parameters
+    ----------
+    path : str
+        Path of the csv or parquet file.
+    version : tuple
+        Modification time in nanoseconds and size of the file in bytes as
+        returned by :py:func:`~._find_turbine_library`.
+
+    Returns
+    -------
+    :pandas:`pandas.DataFrame<frame>`
+        Content of the file with the first column as index.
+
+    """
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    if os.path.getsize(path) > PYARROW_MIN_FILE_SIZE:
+        try:
+            df = pd.read_csv(path, index_col=0, engine="pyarrow")
+        except (ImportError, ValueError):
+            # pyarrow is not installed or pandas does not know the engine
+            pass
+        else:
+            # the pyarrow engine keeps empty strings in text columns
+            return df.replace("", float("nan"))
+    return pd.read_csv(path, index_col=0)
+
+
+def _save_parquet(df, path):
+    r"""
+    Saves a turbine library DataFrame as parquet file next to a csv file.
+
+    Power (coefficient) curves are saved in long format with the columns
+    'turbine_type', 'wind_speed' and 'value', so that the curve of one
+    turbine type can be read without reading the whole file. Nothing is saved
+    if neither pyarrow nor fastparquet is installed or the data cannot be
+    converted. In that case an existing parquet file is deleted, so that it
+    is not read instead of the new csv file.
+
+    Parameters
+    ----------
+    df : :pandas:`pandas.DataFrame<frame>`
+        Turbine library with turbine types as index. Power (coefficient)
+        curves have the wind speeds as columns.
+    path : str
+        Path of the csv file. The parquet file gets the same name with the
+        extension '.parquet'.
+
+    """
+    parquet_path = os.path.splitext(path)[0] + ".parquet"
+    try:
+        df = df.copy()
+        if "turbine_data" in os.path.basename(path):
+            # parquet only supports string column names
+            df.columns = df.columns.astype(str)
+        else:
+            df.columns = df.columns.astype(float)
+            df.columns.name = "wind_speed"
+            df.index.name = "turbine_type"
+            # The rows of a turbine type are stored next to each other in a
+            # single row group. Row groups per turbine type were tried to
+            # read less data per turbine, but the extra metadata made
+            # filtered reads slower for libraries of up to several hundred
+            # turbine types.
+            # wind speeds outside of a turbine's curve are not stored
+            df = df.reset_index().melt(
+                id_vars="turbine_type", var_name="wind_speed"
+            )
+            df = (
+                df[df["value"].notna()]
+                .sort_values(["turbine_type", "wind_speed"], kind="mergesort")
+                .reset_index(drop=True)
+            )
+        df.to_parquet(parquet_path, compression="zstd")
+    except ImportError:
+        logging.debug("No parquet engine installed. Saved csv file only.")
+    except Exception as e:
+        # the parquet file is optional and must not break saving the data
+        logging.warning(
+            "Could not save %s: %s. Saved csv file only.", parquet_path, e
+        )
     else:
-        wpp_df.dropna(axis=1, inplace=True)
-        wpp_df = wpp_df.transpose().reset_index()
-        wpp_df.columns = ["wind_speed", "value"]
-        # transform wind speeds to floats
-        wpp_df["wind_speed"] = wpp_df["wind_speed"].apply(lambda x: float(x))
-        return wpp_df
+        return
+    # remove an outdated or partially written parquet file
+    if os.path.isfile(parquet_path):
+        os.remove(parquet_path)
 
 
 def create_power_curve(wind_speed, power):
@@ -430,6 +815,64 @@ def create_power_curve(wind_speed, power):
     return pd.DataFrame(data={"value": power, "wind_speed": wind_speed})
 
 
+def _parse_list(string):
+    r"""
+    Parses a list of numbers stored as string in the oedb.
+
+    The string is decoded as json and, if that fails, as python literal.
+    Unlike `eval` no code is executed.
+
+    Parameters
+    ----------
+    string : str
+        String representation of a list, e.g. '[0.0, 0.5, 1.0]'.
+
+    Returns
+    -------
+    list
+
+    """
+    try:
+        return json.loads(string)
+    except ValueError:
+        return ast.literal_eval(string)
+
+
+def _get_session():
+    r"""
+    Returns the session used for requests to the oedb.
+
+    The session is created on first use, so requests is only imported if
+    data is loaded from the oedb. Connections are reused and requests are
+    retried on connection errors and server errors of a gateway or proxy.
+
+    Returns
+    -------
+    requests.Session
+
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _SESSION = session
+    return _SESSION
+
+
 def load_turbine_data_from_oedb(schema="supply", table="wind_turbine_library"):
     r"""
     Loads turbine library from the OpenEnergy database (oedb).
@@ -437,6 +880,11 @@ def load_turbine_data_from_oedb(schema="supply", table="wind_turbine_library"):
     Turbine data is saved to csv files ('oedb_power_curves.csv',
     'oedb_power_coefficient_curves.csv' and 'oedb_nominal_power') for offline
     usage of the windpowerlib. If the files already exist they are overwritten.
+    If pyarrow or fastparquet is installed the data is additionally saved to
+    parquet files, which are faster to load.
+
+    Failed requests are retried up to three times. A request times out after
+    the number of seconds set in `OEDB_TIMEOUT`.
 
     Parameters
     ----------
@@ -456,59 +904,58 @@ def load_turbine_data_from_oedb(schema="supply", table="wind_turbine_library"):
     oep_url = "http://oep.iks.cs.ovgu.de/"
 
     # load data
-    result = requests.get(
+    result = _get_session().get(
         oep_url + "/api/v0/schema/{}/tables/{}/rows/?".format(schema, table),
+        timeout=OEDB_TIMEOUT,
     )
     if not result.status_code == 200:
         raise ConnectionError(
             "Database connection not successful. "
             "Response: [{}]".format(result.status_code)
         )
-    # extract data to dataframe
-    turbine_data = pd.DataFrame(result.json())
+    # extract data to dataframe, orjson decodes large responses faster
+    try:
+        import orjson
+    except ImportError:
+        turbine_data = pd.DataFrame(result.json())
+    else:
+        turbine_data = pd.DataFrame(orjson.loads(result.content))
     # standard file name for saving data
     filename = os.path.join(os.path.dirname(__file__), "oedb", "{}.csv")
     # get all power (coefficient) curves and save to file
     # for curve_type in ['power_curve', 'power_coefficient_curve']:
     for curve_type in ["power_curve", "power_coefficient_curve"]:
-        curves_df = pd.DataFrame(columns=["wind_speed"])
+        curves = []
+        wind_speeds = turbine_data["{}_wind_speeds".format(curve_type)]
+        values = turbine_data["{}_values".format(curve_type)]
         for index in turbine_data.index:
-            if (
-                turbine_data["{}_wind_speeds".format(curve_type)][index]
-                and turbine_data["{}_values".format(curve_type)][index]
-            ):
-                df = (
-                    pd.DataFrame(
-                        data=[
-                            eval(
-                                turbine_data[
-                                    "{}_wind_speeds".format(curve_type)
-                                ][index]
-                            ),
-                            eval(
-                                turbine_data["{}_values".format(curve_type)][
-                                    index
-                                ]
-                            ),
-                        ]
-                    )
-                    .transpose()
-                    .rename(
-                        columns={
-                            0: "wind_speed",
-                            1: turbine_data["turbine_type"][index],
-                        }
-                    )
+            if wind_speeds[index] and values[index]:
+                curve = pd.Series(
+                    data=_parse_list(values[index]),
+                    index=_parse_list(wind_speeds[index]),
+                    name=turbine_data["turbine_type"][index],
                 )
-                curves_df = pd.merge(
-                    left=curves_df, right=df, how="outer", on="wind_speed"
-                )
-        curves_df = curves_df.set_index("wind_speed").sort_index().transpose()
+                # curves can only be joined on unique wind speeds, keep the
+                # first value of a repeated wind speed
+                duplicated = curve.index.duplicated()
+                if duplicated.any():
+                    logging.debug(
+                        "Dropped repeated wind speeds in %s of %s.",
+                        curve_type,
+                        curve.name,
+                    )
+                curves.append(curve[~duplicated])
+        # join all curves on their wind speeds at once
+        if curves:
+            curves_df = pd.concat(curves, axis=1).sort_index().transpose()
+        else:
+            curves_df = pd.DataFrame()
         # power curve values in W
         if curve_type == "power_curve":
             curves_df *= 1000
         curves_df.index.name = "turbine_type"
         curves_df.to_csv(filename.format("{}s".format(curve_type)))
+        _save_parquet(curves_df, filename.format("{}s".format(curve_type)))
 
     # get turbine data and save to file (excl. curves)
     turbine_data_df = turbine_data.drop(
@@ -525,6 +972,7 @@ def load_turbine_data_from_oedb(schema="supply", table="wind_turbine_library"):
     # nominal power in W
     turbine_data_df["nominal_power"] *= 1000
     turbine_data_df.to_csv(filename.format("turbine_data"))
+    _save_parquet(turbine_data_df, filename.format("turbine_data"))
     return turbine_data
 
 
@@ -594,7 +1042,7 @@ def get_turbine_types(turbine_library="local", print_out=True, filter_=True):
         filename = os.path.join(
             os.path.dirname(__file__), "oedb", "turbine_data.csv"
         )
-        df = pd.read_csv(filename, index_col=0).reset_index()
+        df = _read_turbine_library(filename).reset_index()
     elif turbine_library == "oedb":
         df = load_turbine_data_from_oedb()
     else:
@@ -603,21 +1051,24 @@ def get_turbine_types(turbine_library="local", print_out=True, filter_=True):
             + "but must be 'local' or 'oedb'."
         )
     if filter_:
-        cp_curves_df = df.loc[df["has_cp_curve"]][
-            ["manufacturer", "turbine_type", "has_cp_curve"]
-        ]
-        p_curves_df = df.loc[df["has_power_curve"]][
-            ["manufacturer", "turbine_type", "has_power_curve"]
-        ]
-        curves_df = pd.merge(
-            p_curves_df, cp_curves_df, how="outer", sort=True
-        ).fillna(False)
+        curves_df = (
+            df.loc[
+                df["has_power_curve"] | df["has_cp_curve"],
+                [
+                    "manufacturer",
+                    "turbine_type",
+                    "has_power_curve",
+                    "has_cp_curve",
+                ],
+            ]
+            .sort_values(["manufacturer", "turbine_type"])
+            .reset_index(drop=True)
+        )
     else:
         curves_df = df[
             ["manufacturer", "turbine_type", "has_power_curve", "has_cp_curve"]
         ]
     if print_out:
-        pd.set_option("display.max_rows", len(curves_df))
-        print(curves_df)
-        pd.reset_option("display.max_rows")
+        # prints all rows without changing pandas' display options
+        print(curves_df.to_string())
     return curves_df